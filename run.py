@@ -3,26 +3,34 @@
 Script de lancement pour Multi-Orchestrator-Bot
 """
 
-import subprocess
-import sys
 import os
+import sys
 
-if __name__ == "__main__":
-    # Définit le PYTHONPATH
-    env = os.environ.copy()
-    env['PYTHONPATH'] = os.path.dirname(__file__)
+import uvicorn
 
-    # Commande uvicorn
-    cmd = [
-        sys.executable, '-m', 'uvicorn',
-        'src.main:app',
-        '--host', '0.0.0.0',
-        '--port', '8000',
-        '--log-level', 'info'
-    ]
+if __name__ == "__main__":
+    # Rend le paquet src importable sans sous-processus ni hack PYTHONPATH
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-    # Mode rechargement si DEBUG=true
-    if os.getenv('DEBUG', 'false').lower() == 'true':
-        cmd.append('--reload')
+    debug = os.getenv('DEBUG', 'false').lower() == 'true'
 
-    subprocess.run(cmd, env=env)
+    # reload et workers sont mutuellement exclusifs dans uvicorn
+    if debug:
+        uvicorn.run(
+            'src.main:app',
+            host='0.0.0.0',
+            port=8000,
+            log_level='info',
+            reload=True,
+        )
+    else:
+        # Un seul worker par défaut : le stockage en mémoire (et l'instantané
+        # STORAGE_SNAPSHOT) est propre à chaque processus. WEB_CONCURRENCY
+        # reste disponible pour qui branche un stockage partagé.
+        uvicorn.run(
+            'src.main:app',
+            host='0.0.0.0',
+            port=8000,
+            log_level='info',
+            workers=int(os.getenv('WEB_CONCURRENCY', 1)),
+        )
@@ -2,8 +2,14 @@
 API FastAPI pour Multi-Orchestrator-Bot
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+import heapq
+import time
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Optional, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone
 
@@ -29,59 +35,75 @@ class TradeCreate(BaseModel):
     quantity: float = Field(..., gt=0)
     price: Optional[float] = Field(None, gt=0)
 
-class MarketDataResponse(BaseModel):
-    symbol: str
-    price: float
-    volume: float
-    timestamp: str
-
 # Création du router FastAPI
 router = APIRouter()
 
+
+async def _stream_json_array(items: Iterable[Any]) -> AsyncIterator[bytes]:
+    """Génère un tableau JSON élément par élément (mémoire constante)
+
+    Générateur async : Starlette enverrait un itérable sync dans le
+    threadpool, un saut de thread par fragment.
+    """
+    yield b'['
+    first = True
+    for item in items:
+        if first:
+            first = False
+        else:
+            yield b','
+        yield orjson.dumps(item)
+    yield b']'
+
 # Routes pour les stratégies
-@router.get("/strategies", response_model=List[dict])
-def get_strategies(
+@router.get("/strategies")
+async def get_strategies(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: Optional[str] = Query(None, pattern=r'^(active|inactive)$')
 ):
     """Récupère toutes les stratégies"""
-    strategies = strategies_storage.get_all()
     if status:
-        strategies = [s for s in strategies if s.status == status]
-    return [s.to_dict() for s in strategies[skip:skip + limit]]
+        strategies = strategies_storage.find_indexed(status=status)
+    else:
+        strategies = strategies_storage.get_all()
+    page = islice(strategies, skip, skip + limit)
+    return StreamingResponse(
+        _stream_json_array(s.to_dict() for s in page),
+        media_type="application/json",
+    )
 
-@router.get("/strategies/{strategy_id}", response_model=dict)
-def get_strategy(strategy_id: int):
+@router.get("/strategies/{strategy_id}")
+async def get_strategy(strategy_id: int):
     """Récupère une stratégie par ID"""
     strategy = strategies_storage.get(strategy_id)
     if not strategy:
         raise HTTPException(status_code=404, detail="Stratégie non trouvée")
     return strategy.to_dict()
 
-@router.post("/strategies", response_model=dict, status_code=201)
-def create_strategy(strategy_data: StrategyCreate):
+@router.post("/strategies", status_code=201)
+async def create_strategy(strategy_data: StrategyCreate):
     """Crée une nouvelle stratégie"""
-    strategy = Strategy(**strategy_data.dict())
+    strategy = Strategy(**strategy_data.model_dump())
     created = strategies_storage.create(strategy)
     return created.to_dict()
 
-@router.put("/strategies/{strategy_id}", response_model=dict)
-def update_strategy(strategy_id: int, strategy_data: StrategyUpdate):
+@router.put("/strategies/{strategy_id}")
+async def update_strategy(strategy_id: int, strategy_data: StrategyUpdate):
     """Met à jour une stratégie"""
     existing = strategies_storage.get(strategy_id)
     if not existing:
         raise HTTPException(status_code=404, detail="Stratégie non trouvée")
 
-    update_data = strategy_data.dict(exclude_unset=True)
+    update_data = strategy_data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(existing, key, value)
 
     updated = strategies_storage.update(strategy_id, existing)
     return updated.to_dict()
 
-@router.patch("/strategies/{strategy_id}/toggle", response_model=dict)
-def toggle_strategy(strategy_id: int):
+@router.patch("/strategies/{strategy_id}/toggle")
+async def toggle_strategy(strategy_id: int):
     """Active/désactive une stratégie"""
     strategy = strategies_storage.get(strategy_id)
     if not strategy:
@@ -92,7 +114,7 @@ def toggle_strategy(strategy_id: int):
     return updated.to_dict()
 
 @router.delete("/strategies/{strategy_id}", status_code=204)
-def delete_strategy(strategy_id: int):
+async def delete_strategy(strategy_id: int):
     """Supprime une stratégie"""
     strategy = strategies_storage.get(strategy_id)
     if not strategy:
@@ -101,25 +123,30 @@ def delete_strategy(strategy_id: int):
     strategies_storage.delete(strategy_id)
 
 # Routes pour les trades
-@router.get("/trades", response_model=List[dict])
-def get_trades(
+@router.get("/trades")
+async def get_trades(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: Optional[str] = Query(None, pattern=r'^(open|closed|cancelled)$'),
     symbol: Optional[str] = None
 ):
     """Récupère tous les trades"""
-    trades = trades_storage.get_all()
+    filters = {}
     if status:
-        trades = [t for t in trades if t.status == status]
+        filters['status'] = status
     if symbol:
-        trades = [t for t in trades if t.symbol == symbol]
-    # Trie par date de création décroissante
-    trades.sort(key=lambda x: x.created_at, reverse=True)
-    return [t.to_dict() for t in trades[skip:skip + limit]]
+        filters['symbol'] = symbol
+    trades = trades_storage.find_indexed(**filters) if filters else trades_storage.get_all()
+    # Sélection partielle des skip+limit plus récents plutôt qu'un tri complet
+    newest = heapq.nlargest(skip + limit, trades, key=lambda x: x.created_at)
+    page = islice(newest, skip, None)
+    return StreamingResponse(
+        _stream_json_array(t.to_dict() for t in page),
+        media_type="application/json",
+    )
 
-@router.post("/trades", response_model=dict, status_code=201)
-def create_trade(trade_data: TradeCreate):
+@router.post("/trades", status_code=201)
+async def create_trade(trade_data: TradeCreate):
     """Crée un nouveau trade"""
     # Utilise le prix fourni ou une valeur par défaut
     effective_price = trade_data.price or 100.0
@@ -136,28 +163,39 @@ def create_trade(trade_data: TradeCreate):
     return created.to_dict()
 
 # Routes pour les données de marché (mockées)
-@router.get("/market/prices", response_model=List[MarketDataResponse])
-def get_market_prices():
+# Cache des prix mockés : (horodatage monotone, payload JSON pré-sérialisé)
+_PRICES_CACHE: Optional[Tuple[float, bytes]] = None
+_PRICES_CACHE_TTL = 1.0  # secondes
+
+@router.get("/market/prices")
+async def get_market_prices() -> Response:
     """Récupère les prix de marché (données mockées)"""
-    mock_data = [
-        MarketDataResponse(symbol="BTC", price=95000.0, volume=1500000.0, timestamp=datetime.now(timezone.utc).isoformat()),
-        MarketDataResponse(symbol="ETH", price=3500.0, volume=800000.0, timestamp=datetime.now(timezone.utc).isoformat()),
-        MarketDataResponse(symbol="SOL", price=180.0, volume=500000.0, timestamp=datetime.now(timezone.utc).isoformat()),
-        MarketDataResponse(symbol="AAPL", price=230.0, volume=1000000.0, timestamp=datetime.now(timezone.utc).isoformat()),
-        MarketDataResponse(symbol="TSLA", price=350.0, volume=2000000.0, timestamp=datetime.now(timezone.utc).isoformat()),
-    ]
-    return mock_data
+    global _PRICES_CACHE
+
+    now = time.monotonic()
+    if _PRICES_CACHE is None or now - _PRICES_CACHE[0] >= _PRICES_CACHE_TTL:
+        # Un seul horodatage partagé par toutes les entrées
+        timestamp = datetime.now(timezone.utc).isoformat()
+        mock_data = [
+            {"symbol": "BTC", "price": 95000.0, "volume": 1500000.0, "timestamp": timestamp},
+            {"symbol": "ETH", "price": 3500.0, "volume": 800000.0, "timestamp": timestamp},
+            {"symbol": "SOL", "price": 180.0, "volume": 500000.0, "timestamp": timestamp},
+            {"symbol": "AAPL", "price": 230.0, "volume": 1000000.0, "timestamp": timestamp},
+            {"symbol": "TSLA", "price": 350.0, "volume": 2000000.0, "timestamp": timestamp},
+        ]
+        _PRICES_CACHE = (now, orjson.dumps(mock_data))
+
+    return Response(content=_PRICES_CACHE[1], media_type="application/json")
 
 # Route pour le dashboard
 @router.get("/dashboard/summary")
-def get_dashboard_summary():
+async def get_dashboard_summary():
     """Récupère le résumé du dashboard"""
-    trades = trades_storage.get_all()
-    closed_trades = [t for t in trades if t.is_closed]
+    closed_trades = trades_storage.find_indexed(status='closed')
 
     total_pnl = sum(t.pnl or 0 for t in closed_trades)
-    open_positions = len([t for t in trades if t.is_open])
-    active_strategies = len(strategies_storage.find_by(status="active"))
+    open_positions = len(trades_storage.find_indexed(status='open'))
+    active_strategies = len(strategies_storage.find_indexed(status='active'))
 
     return {
         "total_pnl": total_pnl,
@@ -168,6 +206,6 @@ def get_dashboard_summary():
 
 # Route de santé
 @router.get("/health")
-def health_check():
+async def health_check():
     """Vérification de santé de l'application"""
     return {"status": "healthy", "version": "1.0.0"}
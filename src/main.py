@@ -2,19 +2,21 @@
 Point d'entrée principal pour Multi-Orchestrator-Bot
 """
 
+import hashlib
 import logging
 import os
+import re
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 
 from .api import router
-from .storage import initialize_sample_data
+from .storage import initialize_sample_data, load_snapshot, save_snapshot
 
 # Logging (safe avec Uvicorn / Gunicorn)
 
@@ -27,14 +29,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Gestionnaire du cycle de vie de l'application"""
     logger.info("Démarrage de Multi-Orchestrator-Bot...")
 
-    try:
+    snapshot_path = os.getenv("STORAGE_SNAPSHOT")
+    restored = False
+    if snapshot_path:
+        try:
+            restored = load_snapshot(snapshot_path)
+            if restored:
+                logger.info("Instantané restauré depuis %s", snapshot_path)
+        except Exception:
+            # load_snapshot vide les stockages avant de relire : un
+            # instantané corrompu laisserait l'application vide sans ce repli
+            logger.exception("Instantané illisible : %s", snapshot_path)
+    if not restored:
         initialize_sample_data()
         logger.info("Données d'exemple initialisées")
-    except Exception:
-        logger.exception("Erreur lors de l'initialisation des données")
 
     yield
 
+    if snapshot_path:
+        try:
+            save_snapshot(snapshot_path)
+            logger.info("Instantané sauvegardé dans %s", snapshot_path)
+        except Exception:
+            logger.exception("Erreur lors de la sauvegarde de l'instantané")
+
     logger.info("Arrêt de Multi-Orchestrator-Bot...")
 
 def create_application() -> FastAPI:
@@ -47,22 +65,36 @@ def create_application() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
-    allowed_origins = os.getenv("ALLOWED_ORIGINS", "*").split(",")
+    allowed_origins = [
+        origin.strip()
+        for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",")
+        if origin.strip()
+    ]
 
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=allowed_origins,
+    cors_options = dict(
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if "*" in allowed_origins:
+        # Le joker court-circuite toute vérification par requête
+        cors_options["allow_origins"] = ["*"]
+    else:
+        # Une seule alternation compilée au démarrage plutôt qu'un scan
+        # linéaire de la liste d'origines à chaque requête
+        cors_options["allow_origin_regex"] = (
+            "^(" + "|".join(map(re.escape, allowed_origins)) + ")$"
+        )
+
+    app.add_middleware(CORSMiddleware, **cors_options)
 
 
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={"detail": exc.detail},
         )
@@ -70,7 +102,7 @@ def create_application() -> FastAPI:
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
         logger.error("Exception globale", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"detail": "Erreur interne du serveur"},
         )
@@ -79,11 +111,27 @@ def create_application() -> FastAPI:
     if os.path.isdir("static"):
         app.mount("/static", StaticFiles(directory="static"), name="static")
 
-    async def read_root() -> FileResponse:
-        index_path = os.path.join("static", "index.html")
-        if not os.path.exists(index_path):
-            raise HTTPException(status_code=404, detail="Page non disponible")
-        return FileResponse(index_path, media_type="text/html")
+    # index.html chargé une seule fois en mémoire : (contenu, ETag)
+    index_cache: dict = {}
+
+    @app.get("/", include_in_schema=False)
+    async def read_root(request: Request) -> Response:
+        if 'page' not in index_cache:
+            index_path = os.path.join("static", "index.html")
+            if not os.path.exists(index_path):
+                raise HTTPException(status_code=404, detail="Page non disponible")
+            with open(index_path, 'rb') as f:
+                content = f.read()
+            index_cache['page'] = (content, hashlib.md5(content).hexdigest())
+
+        content, etag = index_cache['page']
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(
+            content=content,
+            media_type="text/html",
+            headers={"ETag": etag, "Cache-Control": "public, max-age=3600"},
+        )
 
     app.include_router(router, prefix="/api")
 
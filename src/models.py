@@ -2,26 +2,59 @@
 Modèles de données pour le stockage en mémoire
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from itertools import count
+from typing import Dict, Any, Optional, Tuple
 
+# Noms de champs propres à chaque classe (hors champs communs), calculés une
+# seule fois par classe pour éviter une compréhension sur __dict__ par appel.
+_FIELDS_CACHE: Dict[type, Tuple[str, ...]] = {}
 
-@dataclass
+# Générateur d'IDs monotone partagé par tous les modèles.
+# next() sur un count est atomique, donc thread-safe sans verrou.
+_id_seq = count(1)
+
+
+def reset_id_seq(start: int = 1) -> None:
+    """Repositionne le générateur d'IDs (après restauration d'un instantané)"""
+    global _id_seq
+    _id_seq = count(start)
+
+
+def next_id() -> int:
+    """Retourne le prochain ID de la séquence partagée"""
+    # Indirection nécessaire : reset_id_seq relie _id_seq, une référence
+    # directe au count deviendrait obsolète
+    return next(_id_seq)
+
+
+@dataclass(slots=True)
 class BaseModel:
     """Modèle de base avec champs communs"""
-    id: int = field(default_factory=lambda: int(datetime.now().timestamp() * 1000000) % 1000000)
+    id: int = field(default_factory=next_id)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convertit en dictionnaire"""
-        return {
+        cls = type(self)
+        names = _FIELDS_CACHE.get(cls)
+        if names is None:
+            names = tuple(
+                f.name for f in fields(cls)
+                if f.name not in ('id', 'created_at', 'updated_at')
+            )
+            _FIELDS_CACHE[cls] = names
+
+        result = {
             'id': self.id,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
-            **{k: v for k, v in self.__dict__.items() if k not in ['id', 'created_at', 'updated_at']}
         }
+        for name in names:
+            result[name] = getattr(self, name)
+        return result
 
     def update(self, **kwargs) -> None:
         """Met à jour les attributs"""
@@ -31,7 +64,7 @@ class BaseModel:
         self.updated_at = datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class Strategy(BaseModel):
     """Modèle de stratégie de trading"""
     name: str = ""
@@ -72,7 +105,7 @@ class Strategy(BaseModel):
         return self.performance.get('win_rate', 0.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade(BaseModel):
     """Modèle de trade"""
     strategy_id: Optional[int] = None
@@ -2,11 +2,16 @@
 Stockage en mémoire thread-safe
 """
 
-from typing import Dict, List, Optional, TypeVar, Generic
-from threading import Lock
+from collections import defaultdict
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Generic
+from threading import RLock
 from datetime import datetime, timezone
 
-from .models import Strategy, Trade
+import orjson
+
+from .models import Strategy, Trade, next_id, reset_id_seq
 
 T = TypeVar('T')
 
@@ -14,27 +19,67 @@ T = TypeVar('T')
 class InMemoryStorage(Generic[T]):
     """Stockage en mémoire thread-safe"""
 
-    def __init__(self):
+    def __init__(self, indexed_fields: Tuple[str, ...] = ()):
         self._data: Dict[int, T] = {}
-        self._lock = Lock()
-        self._next_id = 1
+        # RLock : les lectures composées (find_by -> register_index) se
+        # réentrent sans interblocage
+        self._lock = RLock()
+        # Index secondaires : champ -> valeur -> ensemble d'IDs
+        self._indexed_fields = indexed_fields
+        self._indexes: Dict[str, Dict[Any, set]] = {
+            f: defaultdict(set) for f in indexed_fields
+        }
+        # Valeurs indexées par ID, pour retirer les anciennes entrées
+        self._indexed_values: Dict[int, Dict[str, Any]] = {}
+        # Instantané de get_all(), invalidé à chaque écriture
+        self._all_cache: Optional[List[T]] = None
+
+    def _index_add(self, item: T) -> None:
+        """Ajoute un élément aux index secondaires"""
+        if not self._indexed_fields:
+            return
+        values = {f: getattr(item, f, None) for f in self._indexed_fields}
+        for field_name, value in values.items():
+            self._indexes[field_name][value].add(item.id)
+        self._indexed_values[item.id] = values
+
+    def _index_remove(self, item_id: int) -> None:
+        """Retire un élément des index secondaires"""
+        values = self._indexed_values.pop(item_id, None)
+        if not values:
+            return
+        for field_name, value in values.items():
+            self._indexes[field_name][value].discard(item_id)
 
     def create(self, item: T) -> T:
         """Crée un nouvel élément"""
         with self._lock:
+            # Séquence partagée de models : un compteur local entrerait en
+            # collision avec les IDs déjà attribués par les dataclasses
             if hasattr(item, 'id') and item.id == 0:
-                item.id = self._next_id
-                self._next_id += 1
+                item.id = next_id()
             self._data[item.id] = item
+            self._index_add(item)
+            self._all_cache = None
             return item
 
+    def __len__(self) -> int:
+        return len(self._data)
+
     def get(self, item_id: int) -> Optional[T]:
         """Récupère un élément par ID"""
+        # Lecture mono-clé : atomique sous le GIL, pas de verrou nécessaire
         return self._data.get(item_id)
 
     def get_all(self) -> List[T]:
         """Récupère tous les éléments"""
-        return list(self._data.values())
+        with self._lock:
+            cache = self._all_cache
+            if cache is None:
+                cache = list(self._data.values())
+                self._all_cache = cache
+            # Copie superficielle : les appelants peuvent trier/filtrer librement
+            return cache.copy()
 
     def update(self, item_id: int, item: T) -> Optional[T]:
         """Met à jour un élément"""
@@ -42,7 +87,10 @@ class InMemoryStorage(Generic[T]):
             if item_id in self._data:
                 if hasattr(item, 'updated_at'):
                     item.updated_at = datetime.now(timezone.utc)
+                self._index_remove(item_id)
                 self._data[item_id] = item
+                self._index_add(item)
+                self._all_cache = None
                 return item
             return None
 
@@ -50,28 +98,112 @@ class InMemoryStorage(Generic[T]):
         """Supprime un élément"""
         with self._lock:
             if item_id in self._data:
+                self._index_remove(item_id)
                 del self._data[item_id]
+                self._all_cache = None
                 return True
             return False
 
+    def register_index(self, field_name: str) -> None:
+        """Construit un index secondaire sur un champ supplémentaire"""
+        with self._lock:
+            if field_name in self._indexes:
+                return
+            index: Dict[Any, set] = defaultdict(set)
+            for item_id, item in self._data.items():
+                value = getattr(item, field_name, None)
+                index[value].add(item_id)
+                self._indexed_values.setdefault(item_id, {})[field_name] = value
+            self._indexes[field_name] = index
+            self._indexed_fields = tuple(self._indexed_fields) + (field_name,)
+
+    def find_indexed(self, **kwargs) -> List[T]:
+        """Trouve des éléments via les index secondaires (O(k))"""
+        with self._lock:
+            id_sets = []
+            for field_name, value in kwargs.items():
+                if field_name not in self._indexes:
+                    raise KeyError(f"Champ non indexé : {field_name}")
+                id_sets.append(self._indexes[field_name].get(value, set()))
+            if not id_sets:
+                return []
+            # Démarre l'intersection par le plus petit ensemble
+            id_sets.sort(key=len)
+            matched = set.intersection(*id_sets)
+            # IDs monotones : le tri restitue l'ordre d'insertion, que la
+            # pagination skip/limit suppose stable
+            return [self._data[item_id] for item_id in sorted(matched) if item_id in self._data]
+
     def find_by(self, **kwargs) -> List[T]:
-        """Trouve des éléments par attributs"""
-        results = []
-        for item in self._data.values():
-            if all(getattr(item, k, None) == v for k, v in kwargs.items()):
-                results.append(item)
-        return results
+        """Trouve des éléments par attributs (index construit au premier appel)"""
+        if not kwargs:
+            return self.get_all()
+        for field_name in kwargs:
+            if field_name not in self._indexes:
+                self.register_index(field_name)
+        return self.find_indexed(**kwargs)
 
     def clear(self) -> None:
         """Vide toutes les données"""
         with self._lock:
             self._data.clear()
-            self._next_id = 1
+            for index in self._indexes.values():
+                index.clear()
+            self._indexed_values.clear()
+            self._all_cache = None
 
 
 # Instances globales de stockage
-strategies_storage = InMemoryStorage[Strategy]()
-trades_storage = InMemoryStorage[Trade]()
+strategies_storage = InMemoryStorage[Strategy](indexed_fields=('status',))
+trades_storage = InMemoryStorage[Trade](indexed_fields=('status', 'symbol'))
+
+
+def _rehydrate(cls, data: Dict[str, Any]):
+    """Reconstruit un modèle depuis un dictionnaire sérialisé"""
+    kwargs = {}
+    for f in fields(cls):
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        # Les datetime sont sérialisés en chaînes ISO par orjson/to_dict
+        if isinstance(value, str) and 'datetime' in str(f.type):
+            value = datetime.fromisoformat(value)
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
+
+def save_snapshot(path: Path) -> None:
+    """Sauvegarde les stockages dans un fichier JSON"""
+    payload = {
+        'strategies': [s.to_dict() for s in strategies_storage.get_all()],
+        'trades': [t.to_dict() for t in trades_storage.get_all()],
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(payload))
+
+
+def load_snapshot(path: Path) -> bool:
+    """Restaure les stockages depuis un instantané ; False si absent"""
+    path = Path(path)
+    if not path.exists():
+        return False
+
+    payload = orjson.loads(path.read_bytes())
+
+    strategies_storage.clear()
+    trades_storage.clear()
+    max_id = 0
+    for data in payload.get('strategies', []):
+        item = strategies_storage.create(_rehydrate(Strategy, data))
+        max_id = max(max_id, item.id)
+    for data in payload.get('trades', []):
+        item = trades_storage.create(_rehydrate(Trade, data))
+        max_id = max(max_id, item.id)
+
+    # Évite les collisions entre IDs restaurés et nouveaux objets
+    reset_id_seq(max_id + 1)
+    return True
 
 
 def initialize_sample_data():
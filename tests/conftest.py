@@ -0,0 +1,23 @@
+"""
+Fixtures partagées pour les tests
+"""
+
+import httpx
+import pytest_asyncio
+
+from src.main import create_application
+
+# Construit à l'import du conftest : sous xdist le coût est payé pendant la
+# collecte, en parallèle du démarrage des autres workers
+_APP = create_application()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Client asynchrone partagé, branché directement sur l'app ASGI"""
+    transport = httpx.ASGITransport(app=_APP)
+    # Le routeur est monté sous /api ; le base_url évite de préfixer chaque appel
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver/api"
+    ) as async_client:
+        yield async_client
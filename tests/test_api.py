@@ -3,36 +3,42 @@ Tests d'intégration pour l'API
 """
 
 import pytest
-from fastapi.testclient import TestClient
 
-from src.main import create_application
 from src.storage import strategies_storage, trades_storage
 
-
-@pytest.fixture
-def client():
-    """Client de test FastAPI"""
-    app = create_application()
-    return TestClient(app)
+# Clés attendues, hissées au niveau module (dict_keys se compare aux ensembles
+# sans allocation intermédiaire)
+_PRICE_KEYS = frozenset({"symbol", "price", "volume", "timestamp"})
+_SUMMARY_KEYS = frozenset({"total_pnl", "open_positions", "active_strategies", "timestamp"})
 
 
 @pytest.fixture(autouse=True)
 def clear_storage():
-    """Vide le stockage avant chaque test"""
-    strategies_storage.clear()
-    trades_storage.clear()
+    """Vide le stockage avant chaque test (uniquement s'il est sale)"""
+    if len(strategies_storage):
+        strategies_storage.clear()
+    if len(trades_storage):
+        trades_storage.clear()
+
+
+@pytest.fixture
+async def created_strategy_id(client):
+    """Crée une stratégie et retourne son ID (prélude partagé des tests CRUD)"""
+    response = await client.post("/strategies", json={"name": "Test", "type": "rsi"})
+    assert response.status_code == 201
+    return response.json()["id"]
 
 
 class TestStrategiesAPI:
     """Tests pour l'API des stratégies"""
 
-    def test_get_strategies_empty(self, client):
+    async def test_get_strategies_empty(self, client):
         """Test récupération stratégies vides"""
-        response = client.get("/strategies")
+        response = await client.get("/strategies")
         assert response.status_code == 200
         assert response.json() == []
 
-    def test_create_strategy(self, client):
+    async def test_create_strategy(self, client):
         """Test création stratégie"""
         data = {
             "name": "Test RSI",
@@ -41,7 +47,7 @@ class TestStrategiesAPI:
             "config": {"period": 14}
         }
 
-        response = client.post("/strategies", json=data)
+        response = await client.post("/strategies", json=data)
         assert response.status_code == 201
 
         result = response.json()
@@ -49,69 +55,53 @@ class TestStrategiesAPI:
         assert result["type"] == "rsi"
         assert result["status"] == "inactive"
 
-    def test_get_strategy_by_id(self, client):
+    async def test_get_strategy_by_id(self, client, created_strategy_id):
         """Test récupération stratégie par ID"""
-        # Créer d'abord
-        data = {"name": "Test", "type": "rsi"}
-        create_response = client.post("/strategies", json=data)
-        strategy_id = create_response.json()["id"]
-
-        # Récupérer
-        response = client.get(f"/strategies/{strategy_id}")
+        response = await client.get(f"/strategies/{created_strategy_id}")
         assert response.status_code == 200
 
         result = response.json()
-        assert result["id"] == strategy_id
+        assert result["id"] == created_strategy_id
         assert result["name"] == "Test"
 
-    def test_get_strategy_not_found(self, client):
+    async def test_get_strategy_not_found(self, client):
         """Test stratégie non trouvée"""
-        response = client.get("/strategies/999")
+        response = await client.get("/strategies/999")
         assert response.status_code == 404
 
-    def test_toggle_strategy(self, client):
+    async def test_toggle_strategy(self, client, created_strategy_id):
         """Test activation/désactivation stratégie"""
-        # Créer
-        data = {"name": "Test", "type": "rsi"}
-        create_response = client.post("/strategies", json=data)
-        strategy_id = create_response.json()["id"]
-
         # Activer
-        response = client.patch(f"/strategies/{strategy_id}/toggle")
+        response = await client.patch(f"/strategies/{created_strategy_id}/toggle")
         assert response.status_code == 200
         assert response.json()["status"] == "active"
 
         # Désactiver
-        response = client.patch(f"/strategies/{strategy_id}/toggle")
+        response = await client.patch(f"/strategies/{created_strategy_id}/toggle")
         assert response.status_code == 200
         assert response.json()["status"] == "inactive"
 
-    def test_delete_strategy(self, client):
+    async def test_delete_strategy(self, client, created_strategy_id):
         """Test suppression stratégie"""
-        # Créer
-        data = {"name": "Test", "type": "rsi"}
-        create_response = client.post("/strategies", json=data)
-        strategy_id = create_response.json()["id"]
-
         # Supprimer
-        response = client.delete(f"/strategies/{strategy_id}")
+        response = await client.delete(f"/strategies/{created_strategy_id}")
         assert response.status_code == 204
 
         # Vérifier suppression
-        response = client.get(f"/strategies/{strategy_id}")
+        response = await client.get(f"/strategies/{created_strategy_id}")
         assert response.status_code == 404
 
 
 class TestTradesAPI:
     """Tests pour l'API des trades"""
 
-    def test_get_trades_empty(self, client):
+    async def test_get_trades_empty(self, client):
         """Test récupération trades vides"""
-        response = client.get("/trades")
+        response = await client.get("/trades")
         assert response.status_code == 200
         assert response.json() == []
 
-    def test_create_trade(self, client):
+    async def test_create_trade(self, client):
         """Test création trade"""
         data = {
             "symbol": "BTC",
@@ -120,7 +110,7 @@ class TestTradesAPI:
             "price": 50000.0
         }
 
-        response = client.post("/trades", json=data)
+        response = await client.post("/trades", json=data)
         assert response.status_code == 201
 
         result = response.json()
@@ -129,7 +119,7 @@ class TestTradesAPI:
         assert result["quantity"] == 0.5
         assert result["status"] == "open"
 
-    def test_create_trade_without_price(self, client):
+    async def test_create_trade_without_price(self, client):
         """Test création trade sans prix"""
         data = {
             "symbol": "BTC",
@@ -137,56 +127,45 @@ class TestTradesAPI:
             "quantity": 0.5
         }
 
-        response = client.post("/trades", json=data)
+        response = await client.post("/trades", json=data)
         assert response.status_code == 201
 
         result = response.json()
         assert result["entry_price"] == 100.0  # Prix par défaut
 
 
-class TestMarketDataAPI:
-    """Tests pour l'API des données de marché"""
-
-    def test_get_market_prices(self, client):
-        """Test récupération prix marché"""
-        response = client.get("/market/prices")
-        assert response.status_code == 200
+def _check_market_prices(data):
+    """Structure des prix de marché"""
+    assert isinstance(data, list)
+    assert len(data) > 0
+    assert data[0].keys() == _PRICE_KEYS
 
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) > 0
 
-        # Vérifier structure
-        item = data[0]
-        assert "symbol" in item
-        assert "price" in item
-        assert "volume" in item
-        assert "timestamp" in item
+def _check_dashboard_summary(data):
+    """Structure du résumé du dashboard"""
+    assert data.keys() == _SUMMARY_KEYS
 
 
-class TestDashboardAPI:
-    """Tests pour l'API du dashboard"""
+def _check_health(data):
+    """Structure de la vérification de santé"""
+    assert data["status"] == "healthy"
+    assert "version" in data
 
-    def test_get_dashboard_summary(self, client):
-        """Test récupération résumé dashboard"""
-        response = client.get("/dashboard/summary")
-        assert response.status_code == 200
 
-        data = response.json()
-        assert "total_pnl" in data
-        assert "open_positions" in data
-        assert "active_strategies" in data
-        assert "timestamp" in data
+class TestReadOnlyEndpoints:
+    """Tests des endpoints en lecture seule (marché, dashboard, santé)"""
 
-
-class TestHealthCheck:
-    """Tests pour la vérification de santé"""
-
-    def test_health_check(self, client):
-        """Test endpoint de santé"""
-        response = client.get("/health")
+    @pytest.mark.parametrize(
+        "path, check",
+        [
+            ("/market/prices", _check_market_prices),
+            ("/dashboard/summary", _check_dashboard_summary),
+            ("/health", _check_health),
+        ],
+        ids=["market_prices", "dashboard_summary", "health"],
+    )
+    async def test_read_only_endpoint(self, client, path, check):
+        """Test GET unique par endpoint, assertions via table de dispatch"""
+        response = await client.get(path)
         assert response.status_code == 200
-
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert "version" in data
+        check(response.json())
@@ -3,11 +3,22 @@ Tests unitaires pour les modèles
 """
 
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from src.models import Strategy, Trade, BaseModel
 
 
+class _FakeDatetime:
+    """Horloge factice strictement croissante, sans lecture du temps réel"""
+    _base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    _tick = 0
+
+    @classmethod
+    def now(cls, tz=None):
+        cls._tick += 1
+        return cls._base + timedelta(microseconds=cls._tick)
+
+
 class TestBaseModel:
     """Tests pour BaseModel"""
 
@@ -26,8 +37,12 @@ class TestBaseModel:
         assert 'created_at' in data
         assert 'updated_at' in data
 
-    def test_update(self):
+    def test_update(self, monkeypatch):
         """Test mise à jour"""
+        # Horloge figée : l'assertion stricte ne dépend plus de la résolution
+        # de l'horloge système
+        monkeypatch.setattr('src.models.datetime', _FakeDatetime)
+
         model = BaseModel()
         original_time = model.updated_at
 
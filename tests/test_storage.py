@@ -0,0 +1,76 @@
+"""
+Tests pour la persistance du stockage en mémoire
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models import Strategy, Trade
+from src.storage import (
+    load_snapshot,
+    save_snapshot,
+    strategies_storage,
+    trades_storage,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_storage():
+    """Vide le stockage avant chaque test (uniquement s'il est sale)"""
+    if len(strategies_storage):
+        strategies_storage.clear()
+    if len(trades_storage):
+        trades_storage.clear()
+
+
+class TestSnapshot:
+    """Tests de l'aller-retour save_snapshot / load_snapshot"""
+
+    def test_roundtrip(self, tmp_path):
+        """Test sauvegarde puis restauration des données"""
+        strategy = strategies_storage.create(
+            Strategy(name="RSI", type="rsi", status="active",
+                     config={"rsi_period": 14})
+        )
+        trade = trades_storage.create(
+            Trade(strategy_id=strategy.id, symbol="BTC", side="buy",
+                  quantity=0.5, entry_price=92000.0)
+        )
+        path = tmp_path / "snapshot.json"
+        save_snapshot(path)
+
+        strategies_storage.clear()
+        trades_storage.clear()
+
+        assert load_snapshot(path) is True
+
+        restored = strategies_storage.get(strategy.id)
+        assert restored.name == "RSI"
+        assert restored.status == "active"
+        assert restored.config == {"rsi_period": 14}
+        # Les datetime ISO redeviennent des objets datetime, à l'identique
+        assert isinstance(restored.created_at, datetime)
+        assert restored.created_at == strategy.created_at
+
+        restored_trade = trades_storage.get(trade.id)
+        assert restored_trade.symbol == "BTC"
+        assert restored_trade.entry_time == trade.entry_time
+        assert restored_trade.exit_time is None
+
+    def test_load_missing_file(self, tmp_path):
+        """Test restauration d'un fichier absent"""
+        assert load_snapshot(tmp_path / "absent.json") is False
+
+    def test_ids_continue_after_restore(self, tmp_path):
+        """Test absence de collision d'IDs après restauration"""
+        strategy = strategies_storage.create(Strategy(name="A", type="manual"))
+        path = tmp_path / "snapshot.json"
+        save_snapshot(path)
+
+        strategies_storage.clear()
+        assert load_snapshot(path) is True
+
+        # Le générateur d'IDs repart au-delà du plus grand ID restauré
+        newer = strategies_storage.create(Strategy(name="B", type="manual"))
+        assert newer.id > strategy.id